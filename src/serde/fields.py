@@ -9,8 +9,8 @@ import re
 import uuid
 from collections.abc import Mapping as MappingType
 
-from serde.exceptions import ContextError, ValidationError, add_context
-from serde.utils import is_subclass, try_lookup, zip_equal
+from serde.exceptions import ContextError, ValidationError
+from serde.utils import intern_str, is_subclass, try_lookup, zip_equal
 
 
 def _resolve(thing, none_allowed=True):
@@ -245,7 +245,8 @@ class Field(_Base):
         """
         super(Field, self)._bind(model_cls)
         self._attr_name = name
-        self._serde_name = self.rename if self.rename else name
+        # Interned names let dictionary lookups match on identity.
+        self._serde_name = intern_str(self.rename if self.rename else name)
 
     def _instantiate_with(self, model, kwargs):
         """
@@ -632,8 +633,11 @@ class _Mapping(_Container):
         Apply the key stage to each key, and the value stage to each value.
         """
         key, value = element
-        with add_context(key):
+        try:
             return (getattr(self.key, stage)(key), getattr(self.value, stage)(value))
+        except ValidationError as e:
+            e._fields.append(key)
+            raise
 
 
 class Dict(_Mapping):
@@ -698,8 +702,11 @@ class _Sequence(_Container):
         Apply a stage to a particular element in the container.
         """
         index, value = element
-        with add_context(index):
+        try:
             return getattr(self.element, stage)(value)
+        except ValidationError as e:
+            e._fields.append(index)
+            raise
 
 
 class Deque(_Sequence):
@@ -819,8 +826,11 @@ class Tuple(_Sequence):
         Apply the element field stage to the corresponding element value.
         """
         field, (index, value) = element
-        with add_context(index):
+        try:
             return getattr(field, stage)(value)
+        except ValidationError as e:
+            e._fields.append(index)
+            raise
 
 
 def create_primitive(name, ty):
@@ -6,9 +6,9 @@ import inspect
 import json
 from collections import OrderedDict
 
-from serde.exceptions import ContextError, add_context
+from serde.exceptions import ContextError, ValidationError, add_context
 from serde.fields import Field, _resolve
-from serde.utils import dict_partition, zip_until_right
+from serde.utils import attrs_getter, dict_partition, zip_until_right
 
 
 __all__ = ['Model']
@@ -35,8 +35,9 @@ class ModelType(type):
 
     This metaclass pulls `~serde.fields.Field` attributes off the defined class.
     These can be accessed using the ``__fields__`` attribute on the class. Model
-    methods use the ``__fields__`` attribute to instantiate, serialize,
-    deserialize, normalize, and validate models.
+    methods use tuple snapshots of the field names and instances, taken when the
+    class is created, to instantiate, serialize, deserialize, normalize, and
+    validate models.
     """
 
     @staticmethod
@@ -103,18 +104,25 @@ class ModelType(type):
                 fields.update(
                     [
                         (name, field)
-                        for name, field in base.__fields__.items()
+                        for name, field in base._fields.items()
                         if name not in attrs
                     ]
                 )
-                tags = base.__tags__ + tags
+                tags = base._tags + tags
                 if not parent:
                     parent = base
 
+        # The new class may be a variant of a tagged parent.
+        for base_tag in tags:
+            base_tag._clear_cache()
+
         # Assign all the things to the Model!
         model_cls._abstract = abstract
         model_cls._parent = parent
         model_cls._fields = Fields(sorted(fields.items(), key=lambda x: x[1].id))
+        model_cls._field_names = tuple(model_cls._fields.keys())
+        model_cls._field_objs = tuple(model_cls._fields.values())
+        model_cls._field_values = attrs_getter(model_cls._field_names)
         model_cls._tag = tag
         model_cls._tags = tags
 
@@ -171,80 +179,97 @@ class Model(object, metaclass=ModelType):
                 fields in the order they are defined on the model class.
             **kwargs: keyword argument values for each field on the model.
         """
-        if self.__class__.__abstract__:
-            raise TypeError(
-                f'unable to instantiate abstract model {self.__class__.__name__!r}'
-            )
+        cls = self.__class__
+
+        if cls._abstract:
+            raise TypeError(f'unable to instantiate abstract model {cls.__name__!r}')
+
+        # Most models are created with keyword arguments only, in which case
+        # there is nothing to bind positionally.
+        if args:
+            cls._bind_args(args, kwargs)
+
+        # A single handler adds the failing field as context, rather than
+        # entering a context manager for every field.
+        field = None
+        try:
+            for field in cls._field_objs:
+                field._instantiate_with(self, kwargs)
+        except ValidationError as e:
+            e._fields.append(field)
+            raise
 
+        if kwargs:
+            kwarg = next(iter(kwargs.keys()))
+            raise TypeError(f'__init__() got an unexpected keyword argument {kwarg!r}')
+
+        self._normalize()
+        self._validate()
+
+    @classmethod
+    def _bind_args(cls, args, kwargs):
+        """
+        Add positional arguments to the keyword arguments, in field order.
+        """
         try:
-            for name, value in zip_until_right(self.__class__.__fields__.keys(), args):
+            for name, value in zip_until_right(cls._field_names, args):
                 if name in kwargs:
                     raise TypeError(
                         f'__init__() got multiple values for keyword argument {name!r}'
                     )
                 kwargs[name] = value
         except ValueError:
-            max_args = len(self.__class__.__fields__) + 1
+            max_args = len(cls._field_names) + 1
             given_args = len(args) + 1
             raise TypeError(
                 f'__init__() takes a maximum of {max_args!r} '
                 f'positional arguments but {given_args!r} were given'
             )
 
-        for field in self.__class__.__fields__.values():
-            with add_context(field):
-                field._instantiate_with(self, kwargs)
-
-        if kwargs:
-            kwarg = next(iter(kwargs.keys()))
-            raise TypeError(f'__init__() got an unexpected keyword argument {kwarg!r}')
-
-        self._normalize()
-        self._validate()
-
     def __eq__(self, other):
         """
         Whether two models are the same.
         """
-        return isinstance(other, self.__class__) and all(
-            getattr(self, name) == getattr(other, name)
-            for name in self.__class__.__fields__.keys()
-        )
+        if self is other:
+            return True
+        cls = self.__class__
+        if cls is not other.__class__:
+            return False
+        return cls._field_values(self) == cls._field_values(other)
 
     def __hash__(self):
         """
         Return a hash value for this model.
         """
-        return hash(
-            tuple(
-                (name, getattr(self, name)) for name in self.__class__.__fields__.keys()
-            )
-        )
+        return hash(self.__class__._field_values(self))
 
     def __repr__(self):
         """
         Return the canonical string representation of this model.
         """
-        return '<{module}.{name} model at 0x{id:x}>'.format(
-            module=self.__class__.__module__,
-            name=self.__class__.__qualname__,
-            id=id(self),
-        )
+        cls = self.__class__
+        return f'<{cls.__module__}.{cls.__qualname__} model at 0x{id(self):x}>'
 
     def to_dict(self):
         """
         Convert this model to a dictionary.
 
         Returns:
-            ~collections.OrderedDict: the model serialized as a dictionary.
+            dict: the model serialized as a dictionary. Keys are in the order
+                the fields are defined on the model class.
         """
-        d = OrderedDict()
+        cls = self.__class__
+        d = {}
 
-        for field in self.__class__.__fields__.values():
-            with add_context(field):
+        field = None
+        try:
+            for field in cls._field_objs:
                 d = field._serialize_with(self, d)
+        except ValidationError as e:
+            e._fields.append(field)
+            raise
 
-        for tag in reversed(self.__class__.__tags__):
+        for tag in reversed(cls._tags):
             with add_context(tag):
                 d = tag._serialize_with(self, d)
 
@@ -276,16 +301,20 @@ class Model(object, metaclass=ModelType):
         model = cls.__new__(cls)
 
         model_cls = None
-        tag = model.__class__.__tag__
+        tag = model.__class__._tag
         while tag and model_cls is not model.__class__:
             model_cls = model.__class__
             with add_context(tag):
                 model, d = tag._deserialize_with(model, d)
-            tag = model.__class__.__tag__
+            tag = model.__class__._tag
 
-        for field in reversed(model.__class__.__fields__.values()):
-            with add_context(field):
+        field = None
+        try:
+            for field in reversed(model.__class__._field_objs):
                 model, d = field._deserialize_with(model, d)
+        except ValidationError as e:
+            e._fields.append(field)
+            raise
 
         model._normalize()
         model._validate()
@@ -314,9 +343,13 @@ class Model(object, metaclass=ModelType):
         is only needed if you modify attributes directly and want to renormalize
         the model instance.
         """
-        for field in self.__class__.__fields__.values():
-            with add_context(field):
+        field = None
+        try:
+            for field in self.__class__._field_objs:
                 field._normalize_with(self)
+        except ValidationError as e:
+            e._fields.append(field)
+            raise
         self.normalize()
 
     def normalize(self):
@@ -336,9 +369,13 @@ class Model(object, metaclass=ModelType):
         is only needed if you modify attributes directly and want to revalidate
         the model instance.
         """
-        for field in self.__class__.__fields__.values():
-            with add_context(field):
+        field = None
+        try:
+            for field in self.__class__._field_objs:
                 field._validate_with(self)
+        except ValidationError as e:
+            e._fields.append(field)
+            raise
         self.validate()
 
     def validate(self):
@@ -2,7 +2,7 @@
 This module contains tag classes for use with `Models <serde.Model>`.
 """
 
-from collections import OrderedDict
+import weakref
 
 from serde import fields, utils
 from serde.exceptions import ValidationError
@@ -31,6 +31,27 @@ class Tag(fields._Base):
         """
         super(Tag, self).__init__(serializers=serializers, deserializers=deserializers)
         self.recurse = recurse
+        self._clear_cache()
+
+    def _attrs(self):
+        """
+        Returns a dictionary of all public attributes on this tag.
+        """
+        excluded = ('id', '_model_cls', '_variants_key', '_variant_lookup')
+        return {
+            name: value for name, value in vars(self).items() if name not in excluded
+        }
+
+    def _clear_cache(self):
+        """
+        Clear the cached variant lookup.
+
+        This is called when a new subclass of the bound model class is created.
+        """
+        # A new key also invalidates a lookup that was being built while the
+        # variants changed.
+        self._variants_key = object()
+        self._variant_lookup = None
 
     def variants(self):
         """
@@ -52,6 +73,9 @@ class Tag(fields._Base):
         """
         Get the tag value for the given model variant.
 
+        The tag values used by `lookup_variant()` are cached until a new variant
+        is created, so this should return the same value for a variant each time.
+
         Args:
             variant (Model): the model class.
 
@@ -70,10 +94,50 @@ class Tag(fields._Base):
         Returns:
             Model: the corresponding Model class.
         """
+        # The lookup is only reused while the variants and whether the bound
+        # model class is abstract are unchanged. It is built before being
+        # stored, so concurrent callers never see a partial lookup.
+        key = (self._variants_key, self.__model__.__abstract__)
+        cache = self._variant_lookup
+        if cache is None or cache[0] != key:
+            cache = (key, self._build_variant_lookup())
+            self._variant_lookup = cache
+
+        lookup = cache[1]
+        if lookup is not None:
+            try:
+                ref = lookup.get(tag)
+            except TypeError:
+                # Unhashable tag values cannot match any variant.
+                return None
+            if ref is None:
+                return None
+            variant = ref()
+            if variant is not None:
+                return variant
+            # The variant was garbage collected, so the lookup is rebuilt.
+            self._variant_lookup = None
+
         for variant in self.variants():
             if self.serialize(variant) == tag:
                 return variant
 
+    def _build_variant_lookup(self):
+        """
+        Build a map of tag value to a weak reference to each variant.
+
+        Returns `None` if a tag value can not be looked up or hashed, in which
+        case `lookup_variant()` falls back to comparing each variant's tag value
+        in turn, until the first match.
+        """
+        lookup = {}
+        try:
+            for variant in self.variants():
+                lookup.setdefault(self.serialize(variant), weakref.ref(variant))
+        except Exception:
+            return None
+        return lookup
+
     def serialize(self, value):
         """
         Serialize a Model variant into a tag value.
@@ -100,8 +164,7 @@ class External(Tag):
         Serialize the model variant by externally tagging the given dictionary.
         """
         variant = model.__class__
-        d = OrderedDict([(self._serialize(variant), d)])
-        return d
+        return {self._serialize(variant): d}
 
     def _deserialize_with(self, model, d):
         """
@@ -130,7 +193,7 @@ class Internal(Tag):
         Create a new `Internal`.
         """
         super(Internal, self).__init__(**kwargs)
-        self.tag = tag
+        self.tag = utils.intern_str(tag)
 
     def _serialize_with(self, model, d):
         """
@@ -168,16 +231,15 @@ class Adjacent(Tag):
         Create a new `Adjacent`.
         """
         super(Adjacent, self).__init__(**kwargs)
-        self.tag = tag
-        self.content = content
+        self.tag = utils.intern_str(tag)
+        self.content = utils.intern_str(content)
 
     def _serialize_with(self, model, d):
         """
         Serialize the model variant by adjacently tagging the given dictionary.
         """
         variant = model.__class__
-        d = OrderedDict([(self.tag, self._serialize(variant)), (self.content, d)])
-        return d
+        return {self.tag: self._serialize(variant), self.content: d}
 
     def _deserialize_with(self, model, d):
         """
@@ -3,12 +3,37 @@ This module defines some utility functions.
 """
 
 import importlib
+import operator
+import sys
 from collections import OrderedDict
+from collections.abc import Sized
 from itertools import zip_longest
 
 from serde.exceptions import MissingDependencyError
 
 
+def attrs_getter(names):
+    """
+    Create a function that returns the given attributes of an object as a tuple.
+
+    This is like `operator.attrgetter` except that the result is always a tuple,
+    even when zero or one names are given.
+
+    Args:
+        names (tuple): the attribute names to get.
+
+    Returns:
+        function: a function taking a single object as an argument.
+    """
+    if not names:
+        return lambda obj: ()
+    elif len(names) == 1:
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    else:
+        return operator.attrgetter(*names)
+
+
 def dict_partition(d, keyfunc, dict=OrderedDict):
     """
     Partition a dictionary.
@@ -33,12 +58,26 @@ def dict_partition(d, keyfunc, dict=OrderedDict):
     return left, right
 
 
+def intern_str(value):
+    """
+    Intern the given value if it is a `str`, so dictionary lookups match on identity.
+
+    Other values, including instances of `str` subclasses which `sys.intern`
+    rejects, are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
 def is_subclass(cls, class_or_tuple):
     """
     Return whether 'cls' is a derived from another class or is the same class.
 
     Does not raise `TypeError` if the given `cls` is not a class.
     """
+    # Most values checked are not classes, so avoid raising and catching an
+    # exception for them.
+    if not isinstance(cls, type):
+        return False
     try:
         return issubclass(cls, class_or_tuple)
     except TypeError:
@@ -87,18 +126,9 @@ def try_lookup(name):
     return obj
 
 
-def zip_equal(*iterables):
+def _zip_equal(*iterables):
     """
-    A zip function that validates that all the iterables have the same length.
-
-    Args:
-        *iterables: the iterables to pass to `zip_longest`.
-
-    Yields:
-        each zipped element.
-
-    Raises:
-        ValueError: if one of the iterables is the wrong length.
+    Zip the given iterables, raising a `ValueError` when one runs out early.
     """
     sentinel = object()
     for element in zip_longest(*iterables, fillvalue=sentinel):
@@ -107,18 +137,32 @@ def zip_equal(*iterables):
         yield element
 
 
-def zip_until_right(*iterables):
+def zip_equal(*iterables):
     """
-    A zip function that validates that the right iterable is consumed.
+    A zip function that validates that all the iterables have the same length.
+
+    If all the iterables are sized their lengths are compared up front and the
+    builtin `zip` is used, otherwise the lengths are checked while iterating.
 
     Args:
-        *iterables: the iterables to pass to `zip`.
+        *iterables: the iterables to zip.
 
-    Yields:
-        each zipped element.
+    Returns:
+        iterator: each zipped element.
 
     Raises:
-        ValueError: if the left iterable is consumed before the right.
+        ValueError: if one of the iterables is the wrong length.
+    """
+    if all(isinstance(iterable, Sized) for iterable in iterables):
+        if len({len(iterable) for iterable in iterables}) > 1:
+            raise ValueError('iterables have different lengths')
+        return zip(*iterables)
+    return _zip_equal(*iterables)
+
+
+def _zip_until_right(*iterables):
+    """
+    Zip the given iterables, raising a `ValueError` if the right is not consumed.
     """
     lefts = iterables[:-1]
     right = iter(iterables[-1])
@@ -130,3 +174,26 @@ def zip_until_right(*iterables):
         raise ValueError('the right-most iterable was not consumed')
     except StopIteration:
         pass
+
+
+def zip_until_right(*iterables):
+    """
+    A zip function that validates that the right iterable is consumed.
+
+    If all the iterables are sized their lengths are compared up front and the
+    builtin `zip` is used, otherwise the right iterable is checked after zipping.
+
+    Args:
+        *iterables: the iterables to zip.
+
+    Returns:
+        iterator: each zipped element.
+
+    Raises:
+        ValueError: if the left iterable is consumed before the right.
+    """
+    if all(isinstance(iterable, Sized) for iterable in iterables):
+        if len(iterables[-1]) > min(len(iterable) for iterable in iterables):
+            raise ValueError('the right-most iterable was not consumed')
+        return zip(*iterables)
+    return _zip_until_right(*iterables)
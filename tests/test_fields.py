@@ -1,6 +1,7 @@
 import collections
 import datetime
 import decimal
+import enum
 import re
 import uuid
 from collections import deque
@@ -244,6 +245,19 @@ class TestField:
         assert field._attr_name == 'test'
         assert field._serde_name == 'hello'
 
+    def test__bind_with_rename_not_str(self):
+        # Make sure _bind accepts renames that are not plain strings.
+        class Key(str, enum.Enum):
+            HELLO = 'hello'
+
+        field = Field(rename=Key.HELLO)
+        field._bind(object(), 'test')
+        assert field._serde_name is Key.HELLO
+
+        field = Field(rename=1)
+        field._bind(object(), 'test')
+        assert field._serde_name == 1
+
     def test__instantiate_with(self):
         # Check a basic Field can instantiate a basic value.
         model = Model()
@@ -1195,6 +1209,34 @@ class TestChoice:
         with raises(ValidationError):
             field.validate(6)
 
+    def test_validate_list(self):
+        # A Choice of a list validates membership for hashable and unhashable
+        # choices and values.
+        field = Choice(['a', 'b', ('c',)])
+        field.validate('a')
+        field.validate(('c',))
+        with raises(ValidationError):
+            field.validate('d')
+        with raises(ValidationError):
+            field.validate(['c'])
+
+        field = Choice([['a'], 'b'])
+        field.validate(['a'])
+        field.validate('b')
+        with raises(ValidationError):
+            field.validate('a')
+
+    def test_validate_modified_choices(self):
+        # A Choice validates against its current choices.
+        field = Choice(['a', 'b'])
+        field.choices.append('c')
+        field.validate('c')
+
+        field.choices = ['z']
+        field.validate('z')
+        with raises(ValidationError):
+            field.validate('a')
+
 
 class TestDateTime:
     def test___init__(self):
@@ -179,6 +179,21 @@ class TestModel:
         assert Example().a == 0
         assert Example(a=5).a == 5
 
+    def test___init___error_context(self):
+        # Check that error context is added to ValidationErrors raised while
+        # instantiating fields.
+
+        def default():
+            raise ValidationError('no default')
+
+        class Example(Model):
+            a = fields.Int()
+            b = fields.Int(default=default)
+
+        with raises(ValidationError) as e:
+            Example(a=5)
+        assert e.value.messages() == {'b': 'no default'}
+
     def test___init___optional(self):
         # Check that an Optional Field behaves as it should.
 
@@ -292,6 +307,9 @@ class TestModel:
         assert Example(a=5) != Example(a=6, b=True)
         assert Example(a=5) == Example(a=5)
 
+        model = Example(a=5)
+        assert model == model
+
     def test___eq___subclass(self):
         # Check that the Model equals method works with subclasses.
 
@@ -372,6 +390,21 @@ class TestModel:
         model._normalize()
         assert model.a == 'tset'
 
+    def test__normalize_error_context(self):
+        # Check that error context is added to ValidationErrors raised while
+        # normalizing.
+
+        def normalizer(value):
+            raise ValidationError('invalid value')
+
+        class Example(Model):
+            a = fields.Int()
+            b = fields.Str(normalizers=[normalizer])
+
+        with raises(ValidationError) as e:
+            Example(a=5, b='test')
+        assert e.value.messages() == {'b': 'invalid value'}
+
     def test__validate(self):
         # _validate() should revalidate the Model so that if we have changed
         # values they are validated.
@@ -761,6 +794,7 @@ class TestModel:
             a = fields.Int()
 
         assert Example(a=5).to_dict() == {'a': 5}
+        assert type(Example(a=5).to_dict()) is dict
 
     def test_to_dict_optional(self):
         # Check that unset optional Fields are not present when serializing.
@@ -806,6 +840,7 @@ class TestModel:
 
         # Serializing data from the variant
         assert SubExample(a=5, b=1.0).to_dict() == {'SubExample': {'a': 5, 'b': 1.0}}
+        assert type(SubExample(a=5, b=1.0).to_dict()) is dict
 
     def test_to_dict_internally_tagged(self):
         # Check that internally tagged variants work correctly.
@@ -847,6 +882,7 @@ class TestModel:
         # Serializing data from the variant
         expected = {'kind': 'SubExample', 'data': {'a': 5, 'b': 1.0}}
         assert SubExample(a=5, b=1.0).to_dict() == expected
+        assert type(SubExample(a=5, b=1.0).to_dict()) is dict
 
     def test_to_dict_override_tag_for(self):
         # Check that to_dict() works when you modify the Meta.tag_for() method
@@ -891,6 +927,21 @@ class TestModel:
 
         assert Example(a='tset').to_dict() == {'a': 'test'}
 
+    def test_to_dict_error_context(self):
+        # Check that error context is added to ValidationErrors raised while
+        # serializing.
+
+        def serializer(value):
+            raise ValidationError('invalid value')
+
+        class Example(Model):
+            a = fields.Int()
+            b = fields.Str(serializers=[serializer])
+
+        with raises(ValidationError) as e:
+            Example(a=5, b='test').to_dict()
+        assert e.value.messages() == {'b': 'invalid value'}
+
     def test_to_json_basic(self):
         # Check that you can serialize to JSON.
 
@@ -1,3 +1,7 @@
+import enum
+import gc
+import sys
+
 import mock
 from pytest import raises
 
@@ -6,6 +10,11 @@ from serde.exceptions import ValidationError
 from serde.tags import Adjacent, External, Internal, Tag
 
 
+class Key(str, enum.Enum):
+    KIND = 'kind'
+    DATA = 'data'
+
+
 class TestTag:
     def test___init___basic(self):
         tag = Tag()
@@ -67,6 +76,60 @@ class TestTag:
         tag._bind(Example)
         assert tag.variants() == [Example2]
 
+    def test_variants_new_variant(self):
+        class Example(Model):
+            class Meta:
+                tag = Tag(recurse=True)
+
+        tag = Example.__tag__
+        assert tag.variants() == [Example]
+
+        class Example2(Example):
+            pass
+
+        class Example3(Example2):
+            pass
+
+        assert tag.variants() == [Example, Example2, Example3]
+
+        Example._abstract = True
+        assert tag.variants() == [Example2, Example3]
+
+    def test_variants_garbage_collected(self):
+        class Example(Model):
+            class Meta:
+                tag = Tag()
+
+        def make():
+            class Example2(Example):
+                pass
+
+            assert Example.__tag__.variants() == [Example, Example2]
+
+        make()
+        gc.collect()
+        assert Example.__subclasses__() == []
+        assert Example.__tag__.variants() == [Example]
+
+    def test_lookup_variant_garbage_collected(self):
+        class Example(Model):
+            class Meta:
+                tag = Tag()
+
+        prefix = 'tests.test_tags.TestTag.test_lookup_variant_garbage_collected'
+        name = prefix + '.<locals>.make.<locals>.Example2'
+
+        def make():
+            class Example2(Example):
+                pass
+
+            assert Example.__tag__.lookup_variant(name) is Example2
+
+        make()
+        gc.collect()
+        assert Example.__subclasses__() == []
+        assert Example.__tag__.lookup_variant(name) is None
+
     def test_lookup_tag(self):
         class Example(Model):
             pass
@@ -92,6 +155,91 @@ class TestTag:
         assert tag.lookup_variant(prefix + '.Example3') is Example3
         assert tag.lookup_variant(prefix + '.Example4') is None
 
+    def test_lookup_variant_new_variant(self):
+        class Example(Model):
+            class Meta:
+                tag = Tag()
+
+        tag = Example.__tag__
+        prefix = 'tests.test_tags.TestTag.test_lookup_variant_new_variant.<locals>'
+        assert tag.lookup_variant(prefix + '.Example') is Example
+        assert tag.lookup_variant(prefix + '.Example2') is None
+
+        class Example2(Example):
+            pass
+
+        assert tag.lookup_variant(prefix + '.Example2') is Example2
+        assert tag.lookup_variant(['unhashable']) is None
+
+    def test_lookup_variant_stops_at_first_match(self):
+        class Custom(Tag):
+            def lookup_tag(self, variant):
+                return variant.code
+
+        class Example(Model):
+            class Meta:
+                abstract = True
+                tag = Custom()
+
+        class Example2(Example):
+            code = 1
+
+        class Example3(Example):
+            pass
+
+        tag = Example.__tag__
+        assert tag.lookup_variant(1) is Example2
+        assert tag.lookup_variant(1) is Example2
+        with raises(AttributeError):
+            tag.lookup_variant(2)
+
+    def test_lookup_variant_interleaved(self):
+        # A lookup that starts while another one is being built, for example
+        # from another thread, still finds every variant.
+        results = []
+
+        class Custom(Tag):
+            def lookup_tag(self, variant):
+                if not results:
+                    results.append(None)
+                    results.append(self.lookup_variant('Example4'))
+                return variant.__name__
+
+        class Example(Model):
+            class Meta:
+                abstract = True
+                tag = Custom()
+
+        class Example2(Example):
+            pass
+
+        class Example3(Example):
+            pass
+
+        class Example4(Example):
+            pass
+
+        assert Example.__tag__.lookup_variant('Example4') is Example4
+        assert results == [None, Example4]
+
+    def test_lookup_variant_unhashable_tag_values(self):
+        class Custom(Tag):
+            def lookup_tag(self, variant):
+                return [variant.__name__]
+
+        class Example(Model):
+            class Meta:
+                tag = Custom()
+
+        class Example2(Example):
+            pass
+
+        tag = Example.__tag__
+        assert tag.lookup_variant(['Example2']) is Example2
+        assert tag.lookup_variant(['Example']) is Example
+        assert tag.lookup_variant(['Example2']) is Example2
+        assert tag.lookup_variant('Example') is None
+
     def test_serialize(self):
         class Example(Model):
             pass
@@ -99,6 +247,19 @@ class TestTag:
         prefix = 'tests.test_tags.TestTag.test_serialize.<locals>'
         assert Tag().serialize(Example) == prefix + '.Example'
 
+    def test_serialize_lookup_tag_changes(self):
+        class Custom(Tag):
+            def lookup_tag(self, variant):
+                return variant.code
+
+        class Example(Model):
+            code = 1
+
+        tag = Custom()
+        assert tag.serialize(Example) == 1
+        Example.code = 2
+        assert tag.serialize(Example) == 2
+
     def test_deserialize(self):
         class Example(Model):
             pass
@@ -172,6 +333,12 @@ class TestInternal:
         assert tag.deserializers == []
         assert tag.serializers == [None]
 
+    def test___init___interned(self):
+        key = ''.join(['ki', 'nd'])
+        assert Internal(tag=key).tag is sys.intern(key)
+        assert Internal(tag=1).tag == 1
+        assert Internal(tag=Key.KIND).tag is Key.KIND
+
     def test__serialize_with(self):
         class Example(Model):
             pass
@@ -231,6 +398,15 @@ class TestAdjacent:
         assert tag.deserializers == []
         assert tag.serializers == [None]
 
+    def test___init___interned(self):
+        tag = Adjacent(tag=''.join(['ki', 'nd']), content=''.join(['da', 'ta']))
+        assert tag.tag is sys.intern('kind')
+        assert tag.content is sys.intern('data')
+
+        tag = Adjacent(tag=Key.KIND, content=Key.DATA)
+        assert tag.tag is Key.KIND
+        assert tag.content is Key.DATA
+
     def test__serialize_with(self):
         class Example(Model):
             pass
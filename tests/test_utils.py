@@ -1,3 +1,8 @@
+import enum
+import json
+import sys
+
+import mock
 from pytest import raises
 
 from serde import Model, fields, utils
@@ -9,9 +14,20 @@ def test_dict_partition():
     assert utils.dict_partition(d, lambda k, v: v == 5) == ({'b': 5}, {'a': 1})
 
 
+def test_intern_str():
+    class Key(str, enum.Enum):
+        KIND = 'kind'
+
+    key = ''.join(['ki', 'nd'])
+    assert utils.intern_str(key) is sys.intern('kind')
+    assert utils.intern_str(Key.KIND) is Key.KIND
+    assert utils.intern_str(1) == 1
+
+
 def test_is_subclass():
     assert utils.is_subclass(5, int) is False
     assert utils.is_subclass(int, int) is True
+    assert utils.is_subclass(int, 5) is False
 
 
 def test_subclasses():
@@ -39,6 +55,14 @@ def test_try_lookup():
     )
 
 
+def test_try_lookup_missing_module():
+    assert utils.try_lookup('json.dumps') is json.dumps
+
+    with mock.patch.dict('sys.modules', {'json': None}):
+        with raises(MissingDependencyError):
+            utils.try_lookup('json.dumps')
+
+
 def test_zip_equal():
     x = [1, 2, 3]
     y = [1, 2, 3, 4]
@@ -53,6 +77,28 @@ def test_zip_equal():
     assert list(utils.zip_equal(x, z)) == [(1, 5), (2, 6), (3, 7)]
 
 
+def test_zip_equal_eager():
+    # Sized iterables are checked before any element is zipped.
+    with raises(ValueError):
+        utils.zip_equal([1, 2, 3], [1, 2, 3, 4])
+
+    assert isinstance(utils.zip_equal([1], [2]), zip)
+
+
+def test_zip_equal_iterators():
+    x = [1, 2, 3]
+    y = [1, 2, 3, 4]
+
+    with raises(ValueError):
+        list(utils.zip_equal(iter(x), y))
+
+    with raises(ValueError):
+        list(utils.zip_equal(y, iter(x)))
+
+    z = [5, 6, 7]
+    assert list(utils.zip_equal(iter(x), z)) == [(1, 5), (2, 6), (3, 7)]
+
+
 def test_zip_until_right():
     x = [1, 2, 3]
     y = [1, 2, 3, 4]
@@ -61,3 +107,23 @@ def test_zip_until_right():
         list(utils.zip_until_right(x, y))
 
     assert list(utils.zip_until_right(y, x)) == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_zip_until_right_iterators():
+    x = [1, 2, 3]
+    y = [1, 2, 3, 4]
+
+    with raises(ValueError):
+        list(utils.zip_until_right(iter(x), y))
+
+    assert list(utils.zip_until_right(y, iter(x))) == [(1, 1), (2, 2), (3, 3)]
+
+
+def test_attrs_getter():
+    class Example(object):
+        a = 1
+        b = 2
+
+    assert utils.attrs_getter(())(Example) == ()
+    assert utils.attrs_getter(('a',))(Example) == (1,)
+    assert utils.attrs_getter(('b', 'a'))(Example) == (2, 1)
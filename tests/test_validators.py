@@ -49,8 +49,21 @@ def test_between():
     with raises(ValidationError):
         Between(-100, 100)(150)
 
-    with raises(ValidationError):
+    with raises(ValidationError) as e:
+        Between(-100, 100)(-150)
+    assert e.value.messages() == 'expected at least -100'
+
+    with raises(ValidationError) as e:
         Between(-100, 100, inclusive=False)(100)
+    assert e.value.messages() == 'expected less than 100'
+
+    with raises(ValidationError) as e:
+        Between(-100, 100, inclusive=False)(-100)
+    assert e.value.messages() == 'expected more than -100'
+
+    between = Between(0, 10)
+    between.max_validator.endpoint = 20
+    between(15)
 
 
 def test_length():